@@ -8,19 +8,42 @@ Created on 23 Nov 2022
 
 import argparse
 import asyncio
-import json
 import logging
 import sys
+from typing import Any, Callable
 
 from serial.serialutil import SerialException
 
 from homeduino import DEFAULT_RECEIVE_PIN, DEFAULT_SEND_PIN, Homeduino
 
+_dumps: Callable[[Any], str]
+_loads: Callable[[str], Any]
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+try:
+    import uvloop
+
+    _LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    _LOOP_FACTORY = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
 def rf_receive_callback(decoded):
-    _LOGGER.info("%s %s", decoded["protocol"], json.dumps(decoded["values"]))
+    _LOGGER.info("%s %s", decoded["protocol"], _dumps(decoded["values"]))
 
 
 async def listen(homeduino_: Homeduino):
@@ -51,7 +74,7 @@ async def send(homeduino_: Homeduino, protocol: str = None, values: str = None):
 
         _LOGGER.debug("Protocol: %s", protocol)
         _LOGGER.debug("Values: %s", values)
-        await homeduino_.rf_send(protocol, values)
+        await homeduino_.rf_send(protocol, _loads(values))
 
     except SerialException as e:
         _LOGGER.error("Failed to connect to Homeduino, reason: %s", e)
@@ -94,17 +117,14 @@ if __name__ == "__main__":
         args.port, rf_receive_pin=args.receive_pin, rf_send_pin=args.send_pin
     )
 
-    loop = asyncio.new_event_loop()
-
     try:
-        if "protocol" in args:
-            asyncio.run(send(homeduino, args.protocol, args.values))
-        else:
-            asyncio.run(listen(homeduino))
+        with asyncio.Runner(loop_factory=_LOOP_FACTORY) as runner:
+            if "protocol" in args:
+                runner.run(send(homeduino, args.protocol, args.values))
+            else:
+                runner.run(listen(homeduino))
     except KeyboardInterrupt:
         # Handle keyboard interrupt
         pass
-    finally:
-        loop.close()
 
     sys.exit(0)
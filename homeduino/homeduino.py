@@ -1,14 +1,12 @@
 import asyncio
+import inspect
 import logging
-import os
 import re
-import sys
 import time
 from asyncio.transports import BaseTransport
-from collections import deque
 from datetime import datetime, timedelta
 from enum import IntEnum
-from functools import partial
+from functools import lru_cache
 from typing import Any, Final, Optional
 
 import serial_asyncio_fast as serial_asyncio
@@ -30,7 +28,10 @@ _BUSY_TIMEOUT = 1
 _RF_SEND_DELAY = 0.2
 _PING_INTERVAL = 5
 _ALLOWED_FAILED_PINGS = 1
-_DHT_READ_DELAY = timedelta(seconds=2)
+_DHT_READ_DELAY = 2
+_PING_PREFIX = b"PING "
+_ALPHANUM_RE = re.compile("([0-9]+)")
+_RF_RECEIVE_RE = re.compile(r"RF receive" + r" ([0-9]+)" * 8 + r" ([0-9]+)")
 
 background_tasks = set()
 
@@ -44,6 +45,61 @@ def _add_background_task(task: asyncio.Task) -> None:
     task.add_done_callback(background_tasks.discard)
 
 
+def _run_rf_receive_callback(rf_receive_callback, decoded: dict) -> None:
+    result = rf_receive_callback(decoded)
+    if inspect.isawaitable(result):
+        # Callable objects with an async __call__ are not detected as coroutine functions
+        _add_background_task(asyncio.ensure_future(result))
+
+
+def _set_low_latency_mode(transport: SerialTransport) -> None:
+    # USB serial adapters buffer received data for up to 16 ms by default, setting the low
+    # latency flag makes command responses arrive without that delay. This is only supported
+    # on Linux and not by all drivers, so failing to set it is not an error.
+    if transport.serial is None:
+        return
+
+    try:
+        transport.serial.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError) as ex:
+        logger.debug("Unable to set low latency mode: %s", ex)
+
+
+def _alphanum_key(key: str) -> list:
+    return [int(c) if c.isdigit() else c.lower() for c in _ALPHANUM_RE.split(key)]
+
+
+@lru_cache(maxsize=1)
+def _get_protocols() -> tuple[str, ...]:
+    # The protocols supported by rfcontrol don't change at runtime
+    protocol_names = [protocol.name for protocol in controller.get_all_protocols()]
+    return tuple(sorted(protocol_names, key=_alphanum_key))
+
+
+@lru_cache(maxsize=1)
+def _get_protocols_by_name() -> dict[str, Any]:
+    return {protocol.name: protocol for protocol in controller.get_all_protocols()}
+
+
+def _resolve_protocol(name: str):
+    try:
+        return _get_protocols_by_name()[name]
+    except KeyError as ex:
+        raise controller.RFControlProtocolNotFoundError(
+            f"Unknown RF protocol '{name}'"
+        ) from ex
+
+
+@lru_cache(maxsize=512)
+def _decode_pulses(pulse_lengths: tuple[int, ...], pulse_sequence: str) -> tuple:
+    # Remotes repeat the same frame several times, so only decode each unique frame once. The
+    # result is cached in an immutable form so callbacks can't alter it.
+    return tuple(
+        (decoded["protocol"], tuple(decoded["values"].items()))
+        for decoded in controller.decode_pulses(pulse_lengths, pulse_sequence)
+    )
+
+
 class HomeduinoError(Exception):
     """Generic Homeduino error."""
 
@@ -69,144 +125,235 @@ class HomeduinoTooBusyError(HomeduinoError):
 
 
 class HomeduinoProtocol(asyncio.Protocol):
-    transport: SerialTransport = None
-
-    ready = False
-    _last_rf_send = None
-    last_message_received = None
-
-    _str_buffer = ""
-    _awaiting_response = False
+    __slots__ = (
+        "transport",
+        "ready_event",
+        "disconnected_event",
+        "_last_rf_send",
+        "last_message_received_ns",
+        "_rf_receive_callbacks",
+        "_buffer",
+        "_response_waiter",
+        "_send_lock",
+        "_line_handlers",
+    )
 
     def __init__(
         self,
         **_kwargs: Any,
     ):
         """Initialize class."""
-        self._rf_receive_callbacks = []
-        self.response_buffer = deque()
+        self.transport: SerialTransport | None = None
+        self.ready_event = asyncio.Event()
+        self.disconnected_event = asyncio.Event()
+        self._last_rf_send: float | None = None
+        self.last_message_received_ns: int | None = None
+
+        self._rf_receive_callbacks: tuple = ()
+        self._buffer = bytearray()
+        self._response_waiter: asyncio.Future | None = None
         self._send_lock = asyncio.Lock()
+        # Unsolicited messages are dispatched on their first token
+        self._line_handlers = {
+            b"ready": self._handle_ready_line,
+            b"RF": self.handle_rf_receive,
+            b"KP": self.handle_key_press,
+        }
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_event.is_set()
+
+    @property
+    def last_message_received(self) -> datetime | None:
+        """The wall clock time the last message was received."""
+        if self.last_message_received_ns is None:
+            return None
+        age_ns = time.monotonic_ns() - self.last_message_received_ns
+        return datetime.now() - timedelta(microseconds=age_ns // 1000)
 
     def busy(self):
         return self._send_lock.locked()
 
     async def set_rf_receive_interrupt(self, rf_receive_interrupt: int) -> bool:
         if rf_receive_interrupt is not None:
-            response = await self.send(f"RF receive {rf_receive_interrupt}")
+            response = await self.send(b"RF receive %d" % rf_receive_interrupt)
             return response == "ACK"
         return False
 
     def add_rf_receive_callback(self, rf_receive_callback) -> None:
         if rf_receive_callback is not None:
-            self._rf_receive_callbacks.append(rf_receive_callback)
+            # Copy on write, handle_rf_receive iterates the tuple without copying it
+            self._rf_receive_callbacks = (
+                *self._rf_receive_callbacks,
+                (
+                    inspect.iscoroutinefunction(rf_receive_callback),
+                    rf_receive_callback,
+                ),
+            )
 
     def connection_made(self, transport: BaseTransport) -> None:
         self.transport = transport
 
     def data_received(self, data) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received data: %r", data)
+        # The buffered data never contains a line end, so only the new data and the last
+        # buffered byte, which could be the \r of a split line end, need to be searched
+        start = max(len(self._buffer) - 1, 0)
+        self._buffer.extend(data)
+        if self._buffer.find(b"\r\n", start) < 0:
+            return
+
+        # Split all complete lines in one pass, the partial last line stays in the buffer
+        lines = self._buffer.split(b"\r\n")
+        self._buffer = lines.pop()
+        for line_bytes in lines:
+            self._dispatch_line(bytes(line_bytes).strip())
+
+    def _dispatch_line(self, line_bytes: bytes) -> None:
         try:
-            decoded_data = data.decode()
+            line = line_bytes.decode()
         except UnicodeDecodeError:
-            invalid_data = data.decode(errors="replace")
+            invalid_data = line_bytes.decode(errors="replace")
             logger.warning(
                 "Error during decode of data, invalid data: %s", invalid_data
             )
-        else:
-            logger.debug("Received data: %s", decoded_data.strip())
-            self._str_buffer += decoded_data
-            while "\r\n" in self._str_buffer:
-                line, self._str_buffer = self._str_buffer.split("\r\n", 1)
-                line = line.strip()
-                if line == "ready":
-                    self.handle_ready()
-                elif line.startswith("RF receive "):
-                    self.handle_rf_receive(line)
-                elif line.startswith("KP "):
-                    self.handle_key_press(line)
-                elif line != "" and self._awaiting_response:
-                    self.response_buffer.append(line)
-                elif line.startswith("PING "):
-                    logger.warning("Unhandled data received '%s'", line)
-                elif line != "":
-                    logger.error("Unhandled data received '%s'", line)
-                self.last_message_received = datetime.now()
+            return
+
+        head, _, _ = line_bytes.partition(b" ")
+        line_handler = self._line_handlers.get(head)
+        if line_handler is not None:
+            # The lines following this one are already taken from the buffer, so a failing
+            # handler must not prevent them from being dispatched
+            try:
+                line_handler(line)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Error while handling data '%s'", line)
+        elif (
+            line != ""
+            and self._response_waiter is not None
+            and not self._response_waiter.done()
+        ):
+            self._response_waiter.set_result(line)
+        elif line.startswith("PING "):
+            logger.warning("Unhandled data received '%s'", line)
+        elif line != "":
+            logger.error("Unhandled data received '%s'", line)
+        self.last_message_received_ns = time.monotonic_ns()
 
     def handle_ready(self) -> None:
-        self.ready = True
+        self.ready_event.set()
         logger.info("Homeduino is connected")
 
+    def _handle_ready_line(self, _line: str) -> None:
+        self.handle_ready()
+
     def handle_rf_receive(self, line: str) -> None:
-        logger.debug(line)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(line)
+
+        rf_receive_callbacks = self._rf_receive_callbacks
+        if len(rf_receive_callbacks) == 0:
+            # Nobody is interested, don't spend time on decoding
+            logger.debug("No receive callbacks configured")
+            return
 
         # The first 8 numbers are the pulse lengths and the last string of numbers is the pulse
         # sequence.
-        parts = line.split(" ")
+        match = _RF_RECEIVE_RE.fullmatch(line)
+        if match is None:
+            logger.warning("Malformed RF receive message '%s'", line)
+            return
 
-        pulse_lengths = [int(i) for i in parts[2:10]]
+        pulse_lengths = tuple(map(int, match.group(1, 2, 3, 4, 5, 6, 7, 8)))
         # logger.debug("pulse lengths: %s", pulse_lengths)
-        pulse_sequence = parts[10]
+        pulse_sequence = match.group(9)
 
-        # Match pulse sequence to a protocol
-        decoded = controller.decode_pulses(pulse_lengths, pulse_sequence)
+        try:
+            decoded_pulses = _decode_pulses(pulse_lengths, pulse_sequence)
+        except (ValueError, IndexError):
+            # The pulse sequence refers to pulse lengths that are zero or missing
+            logger.warning("Malformed RF receive message '%s'", line)
+            return
+
+        # Match pulse sequence to a protocol, each received frame gets its own values
+        decoded = [
+            {"protocol": protocol_name, "values": dict(values)}
+            for protocol_name, values in decoded_pulses
+        ]
 
         if len(decoded) == 0:
             logger.warning("No protocol for %s %s", pulse_lengths, pulse_sequence)
-        elif len(self._rf_receive_callbacks) == 0:
-            logger.debug("No receive callbacks configured")
         else:
+            logger.debug("Forwarding RF protocols to receive callbacks")
+            # Callbacks run after data_received returns, so slow callbacks don't hold up
+            # reading the serial port
+            loop = asyncio.get_running_loop()
             for protocol in decoded:
-                logger.debug("Forwarding RF protocol to receive callbacks")
-                for rf_receive_callback in self._rf_receive_callbacks:
-                    rf_receive_callback(protocol)
+                for is_coroutine, rf_receive_callback in rf_receive_callbacks:
+                    if is_coroutine:
+                        _add_background_task(
+                            loop.create_task(rf_receive_callback(protocol))
+                        )
+                    else:
+                        loop.call_soon(
+                            _run_rf_receive_callback, rf_receive_callback, protocol
+                        )
 
     def handle_key_press(self, line: str) -> None:
-        logger.debug(line)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(line)
         # Ignoring key presses for now
 
-    async def send(self, packet: str) -> str:
+    async def send(self, packet: str | bytes) -> str:
         """Encode and put packet string onto write buffer."""
 
         if not self.transport:
             raise HomeduinoDisconnectedError("Homeduino is not connected")
 
-        is_rf_send = packet.startswith("RF send ")
+        if isinstance(packet, str):
+            # All Homeduino commands are plain ASCII
+            packet = packet.encode("ascii")
+
+        is_rf_send = packet.startswith(b"RF send ")
         if is_rf_send and self._last_rf_send is not None:
             # Allow some time between rf send commands to prevent flooding
-            while (
-                datetime.now() - self._last_rf_send
-            ).total_seconds() <= _RF_SEND_DELAY:
+            remaining = _RF_SEND_DELAY - (time.monotonic() - self._last_rf_send)
+            if remaining > 0:
                 logger.debug("RF send delay")
-                await asyncio.sleep(0.01)
+                await asyncio.sleep(remaining)
 
         try:
-            data = packet + "\n"
+            data = packet + b"\n"
             # type ignore: transport from create_connection is documented to be
             # implementation specific bidirectional, even though typed as
             # BaseTransport
             async with self._send_lock:
-                self._awaiting_response = True
-                logger.debug("Writing data: %s", repr(data))
-                self.transport.write(data.encode())  # type: ignore
-
-                timeout = time.time() + _RESPONSE_TIMEOUT
-                while len(self.response_buffer) == 0:
-                    if time.time() > timeout:
-                        logger.error("Timeout while waiting for command response")
-                        raise HomeduinoResponseTimeoutError(
-                            "Timeout while waiting for command response"
-                        )
-                    logger.debug("Waiting for command response")
-                    await asyncio.sleep(0.01)
-
-                self._awaiting_response = False
+                # The response is resolved by data_received as soon as it arrives
+                self._response_waiter = asyncio.get_running_loop().create_future()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Writing data: %r", data)
+                self.transport.write(data)  # type: ignore
+
+                try:
+                    response = await asyncio.wait_for(
+                        self._response_waiter, _RESPONSE_TIMEOUT
+                    )
+                except asyncio.TimeoutError as ex:
+                    logger.error("Timeout while waiting for command response")
+                    raise HomeduinoResponseTimeoutError(
+                        "Timeout while waiting for command response"
+                    ) from ex
+                finally:
+                    self._response_waiter = None
 
-            response = self.response_buffer.pop()
             logger.debug("Command response received: %s", response)
             return response.strip()
         finally:
             if is_rf_send:
                 # Set last RF send timestamp
-                self._last_rf_send = datetime.now()
+                self._last_rf_send = time.monotonic()
 
         return None
 
@@ -218,7 +365,8 @@ class HomeduinoProtocol(asyncio.Protocol):
             logger.info("Disconnected because of close/abort")
 
         self.transport = None
-        self.ready = False
+        self.ready_event.clear()
+        self.disconnected_event.set()
 
 
 class HomeduinoPinMode(IntEnum):
@@ -228,12 +376,23 @@ class HomeduinoPinMode(IntEnum):
 
 
 class Homeduino:
-    rf_receive_interrupt: int | None = None
-
-    protocol: HomeduinoProtocol = None
-
-    _ping_and_read_task = None
-    _loop = None
+    __slots__ = (
+        "serial_port",
+        "baud_rate",
+        "rf_receive_interrupt",
+        "rf_send_pin",
+        "protocol",
+        "_ping_and_read_task",
+        "_loop",
+        "_rf_receive_callbacks",
+        "_rf_send_headers",
+        "_digital_read_callbacks",
+        "_analog_read_callbacks",
+        "_dht_read_callbacks",
+        "_digital_read_items",
+        "_analog_read_items",
+        "_dht_read_items",
+    )
 
     def __init__(
         self,
@@ -242,51 +401,55 @@ class Homeduino:
         rf_receive_pin: int | None = DEFAULT_RECEIVE_PIN,
         rf_send_pin: int | None = DEFAULT_SEND_PIN,
     ):
-        # Test if the device exists
-        if not os.path.exists(serial_port):
-            logger.warning("No such file or directory: '%s'", serial_port)
-
         self.serial_port = serial_port
         self.baud_rate = baud_rate
+        self.rf_receive_interrupt: int | None = None
         if rf_receive_pin is not None:
             self.rf_receive_interrupt = rf_receive_pin - 2
         self.rf_send_pin = rf_send_pin
 
+        self.protocol: HomeduinoProtocol = None
+        self._ping_and_read_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
         self._rf_receive_callbacks = []
+        self._rf_send_headers: dict[tuple[int | None, str, int], bytes] = {}
         self._digital_read_callbacks = {}
         self._analog_read_callbacks = {}
         self._dht_read_callbacks = {}
+        # Snapshots of the read callbacks, refreshed when a pin is added, for the ping and
+        # read coroutine to iterate
+        self._digital_read_items: tuple = ()
+        self._analog_read_items: tuple = ()
+        self._dht_read_items: tuple = ()
 
     async def _connect(self) -> bool:
         if not self.connected():
             if self._loop is None:
-                self._loop = asyncio.get_event_loop()
+                self._loop = asyncio.get_running_loop()
 
             logger.info("Connecting to %s", self.serial_port)
             try:
-                protocol_factory = partial(HomeduinoProtocol)
-
                 (
-                    _transport,
+                    transport,
                     self.protocol,
                 ) = await serial_asyncio.create_serial_connection(
                     self._loop,
-                    protocol_factory,
+                    HomeduinoProtocol,
                     self.serial_port,
                     baudrate=self.baud_rate,
                     bytesize=serial_asyncio.serial.EIGHTBITS,
                     parity=serial_asyncio.serial.PARITY_NONE,
                     stopbits=serial_asyncio.serial.STOPBITS_ONE,
                 )
+                _set_low_latency_mode(transport)
 
-                start_time = datetime.now()
-                while not self.protocol.ready:
-                    if (datetime.now() - start_time).total_seconds() > _READY_TIMEOUT:
-                        break
-                    logger.debug("Waiting for Homeduino to become ready")
-                    await asyncio.sleep(0.1)
-
-                if not self.protocol.ready:
+                logger.debug("Waiting for Homeduino to become ready")
+                try:
+                    await asyncio.wait_for(
+                        self.protocol.ready_event.wait(), _READY_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
                     logger.warning(
                         "Timeout while waiting for Homeduino to become ready, trying to ping instead"
                     )
@@ -317,7 +480,7 @@ class Homeduino:
         if not self.connected() and await self._connect():
             if ping_interval > 0:
                 self._ping_and_read_task = asyncio.create_task(
-                    self._ping_and_read_coroutine(timedelta(seconds=ping_interval))
+                    self._ping_and_read_coroutine(ping_interval)
                 )
                 _add_background_task(self._ping_and_read_task)
 
@@ -337,15 +500,16 @@ class Homeduino:
             if self.protocol.transport is not None:
                 self.protocol.transport.close()
 
-            start_time = datetime.now()
-            while self.protocol.ready:
-                if (datetime.now() - start_time).total_seconds() > _READY_TIMEOUT:
-                    logger.error("Timeout while waiting for Homeduino to disconnect")
-                    raise HomeduinoResponseTimeoutError(
-                        "Timeout while waiting for Homeduino to disconnect"
-                    )
-                logger.debug("Waiting for Homeduino to disconnect")
-                await asyncio.sleep(0.01)
+            logger.debug("Waiting for Homeduino to disconnect")
+            try:
+                await asyncio.wait_for(
+                    self.protocol.disconnected_event.wait(), _READY_TIMEOUT
+                )
+            except asyncio.TimeoutError as ex:
+                logger.error("Timeout while waiting for Homeduino to disconnect")
+                raise HomeduinoResponseTimeoutError(
+                    "Timeout while waiting for Homeduino to disconnect"
+                ) from ex
 
             self.protocol = None
             logger.debug("Homeduino disconnected")
@@ -363,10 +527,10 @@ class Homeduino:
 
     async def _ping(self) -> bool:
         logger.debug("Pinging Homeduino")
-        message = f"PING {time.time()}"
+        token = str(time.monotonic_ns())
 
-        response = await self.protocol.send(message)
-        if response == message:
+        response = await self.protocol.send(_PING_PREFIX + token.encode("ascii"))
+        if response == f"PING {token}":
             logger.debug("Pinging Homeduino successful")
             return True
 
@@ -396,12 +560,14 @@ class Homeduino:
             self._digital_read_callbacks[digital_io].append(digital_read_callback)
         else:
             self._digital_read_callbacks[digital_io] = [digital_read_callback]
+            self._digital_read_items = tuple(self._digital_read_callbacks.items())
 
     def add_analog_read_callback(self, analog_input: int, analog_read_callback) -> None:
         if analog_input in self._analog_read_callbacks:
             self._analog_read_callbacks[analog_input].append(analog_read_callback)
         else:
             self._analog_read_callbacks[analog_input] = [analog_read_callback]
+            self._analog_read_items = tuple(self._analog_read_callbacks.items())
 
     async def add_dht_read_callback(
         self, dht_type: int, digital_io: int, dht_read_callback
@@ -412,6 +578,7 @@ class Homeduino:
             self._dht_read_callbacks[digital_io][1].append(dht_read_callback)
         else:
             self._dht_read_callbacks[digital_io] = [dht_type, [dht_read_callback]]
+            self._dht_read_items = tuple(self._dht_read_callbacks.items())
 
     def supports_rf_send(self):
         return self.rf_send_pin is not None
@@ -433,61 +600,64 @@ class Homeduino:
             raise HomeduinoDisconnectedError("Homeduino is not connected")
 
         if self.supports_rf_send():
-            rf_protocol = getattr(sys.modules[controller.__name__], rf_protocol)
-            logger.debug(rf_protocol)
-
-            packet = f"RF send {self.rf_send_pin} {repeats} "
-
-            for pulse_length in rf_protocol.pulse_lengths:
-                packet += f"{pulse_length} "
-
-            i = len(rf_protocol.pulse_lengths)
-            while i < 8:
-                packet += "0 "
-                i += 1
-
-            packet += rf_protocol.encode(**values)
+            protocol = _resolve_protocol(rf_protocol)
+            logger.debug(protocol)
+
+            # Only the pulse sequence depends on the values, the header is cached
+            header_key = (self.rf_send_pin, rf_protocol, repeats)
+            header = self._rf_send_headers.get(header_key)
+            if header is None:
+                # The packet always contains 8 pulse lengths, padded with zeros
+                parts = [f"RF send {self.rf_send_pin} {repeats}"]
+                parts.extend(
+                    str(pulse_length) for pulse_length in protocol.pulse_lengths
+                )
+                parts.extend(["0"] * (8 - len(protocol.pulse_lengths)))
+                parts.append("")
+                header = " ".join(parts).encode("ascii")
+                self._rf_send_headers[header_key] = header
+            packet = header + protocol.encode(**values).encode("ascii")
 
             response = await self.protocol.send(packet)
             return response == "ACK"
 
         return False
 
-    async def send(self, command) -> str:
+    async def send(self, command: str | bytes) -> str:
         if not self.connected():
             raise HomeduinoDisconnectedError("Homeduino is not connected")
 
         return await self.protocol.send(command)
 
     async def pin_mode(self, digital_io: int, mode: HomeduinoPinMode):
-        response = await self.send(f"PM {digital_io} {mode}")
+        response = await self.send(b"PM %d %d" % (digital_io, mode))
         success = response == "ACK"
 
         return success
 
     async def digital_write(self, digital_io: int, value: bool):
-        response = await self.send(f"DW {digital_io} {1 if value else 0}")
+        response = await self.send(b"DW %d %d" % (digital_io, 1 if value else 0))
         return response == "ACK"
 
     async def digital_read(self, digital_io: int) -> bool:
-        response = await self.send(f"DR {digital_io}")
+        response = await self.send(b"DR %d" % digital_io)
         return response == "ACK 1"
 
     async def analog_write(self, digital_io: int, value: int):
         if digital_io not in (3, 5, 6, 9, 10, 11):
             return False
 
-        response = await self.send(f"DW {digital_io} {value}")
+        response = await self.send(b"DW %d %d" % (digital_io, value))
         return response == "ACK"
 
     async def analog_read(self, analog_input: int) -> int:
-        response = await self.send(f"AR {analog_input}")
-        response = response.split(" ")[1]
-        return int(response)
+        response = await self.send(b"AR %d" % analog_input)
+        _, _, value = response.partition(" ")
+        return int(value)
 
     async def dht_read(self, dht_type: int, digital_io: int) -> int:
-        response = await self.send(f"DHT {dht_type} {digital_io}")
-        response = response.split(" ")
+        response = await self.send(b"DHT %d %d" % (dht_type, digital_io))
+        response = response.split(" ", 3)
         try:
             temperature = float(response[1])
             humidity = float(response[2])
@@ -500,15 +670,7 @@ class Homeduino:
     @staticmethod
     def get_protocols() -> [str]:
         """Returns the supported protocols in natural sorted order"""
-
-        def convert(text):
-            return int(text) if text.isdigit() else text.lower()
-
-        def alphanum_key(key: str):
-            return [convert(c) for c in re.split("([0-9]+)", key)]
-
-        protocol_names = [protocol.name for protocol in controller.get_all_protocols()]
-        return sorted(protocol_names, key=alphanum_key)
+        return list(_get_protocols())
 
     async def _cancel_ping_and_read(self) -> bool:
         if self._ping_and_read_task is not None and not (
@@ -518,7 +680,7 @@ class Homeduino:
 
         return True
 
-    async def _ping_and_read_coroutine(self, ping_interval: timedelta):
+    async def _ping_and_read_coroutine(self, ping_interval: float):
         """
         To test the connection for availability a ping message can be sent every interval if no
         other messages where received during the interval.
@@ -528,8 +690,14 @@ class Homeduino:
         analog_input_values = [None] * 8
         dht_values = [(None, None)] * 14
         last_dht_read = None
-        sleep_time = 0.1
+        ping_interval_ns = int(ping_interval * 1_000_000_000)
         while True:
+            # Poll inputs at a higher rate than the connection is tested
+            if self._digital_read_callbacks or self._analog_read_callbacks:
+                sleep_time = 0.01
+            else:
+                sleep_time = 0.1
+
             try:
                 if not self.connected():
                     await self._reconnect()
@@ -538,8 +706,7 @@ class Homeduino:
                     for (
                         digital_io,
                         digital_read_callbacks,
-                    ) in self._digital_read_callbacks.copy().items():
-                        sleep_time = 0.01
+                    ) in self._digital_read_items:
                         if not self.protocol.busy():
                             value = await self.digital_read(digital_io)
                             previous_value = digital_io_values[digital_io]
@@ -552,8 +719,7 @@ class Homeduino:
                     for (
                         analog_input,
                         analog_read_callbacks,
-                    ) in self._analog_read_callbacks.copy().items():
-                        sleep_time = 0.01
+                    ) in self._analog_read_items:
                         if not self.protocol.busy():
                             value = await self.analog_read(analog_input)
                             previous_value = analog_input_values[analog_input]
@@ -565,12 +731,12 @@ class Homeduino:
 
                     if (
                         last_dht_read is None
-                        or datetime.now() > last_dht_read + _DHT_READ_DELAY
+                        or time.monotonic() > last_dht_read + _DHT_READ_DELAY
                     ):
                         for (
                             digital_io,
                             (dht_type, dht_read_callbacks),
-                        ) in self._dht_read_callbacks.copy().items():
+                        ) in self._dht_read_items:
                             if not self.protocol.busy():
                                 (temperature, humidity) = await self.dht_read(
                                     dht_type, digital_io
@@ -591,11 +757,13 @@ class Homeduino:
                                     for dht_read_callback in dht_read_callbacks:
                                         dht_read_callback(temperature, humidity)
                                     dht_values[digital_io] = (temperature, humidity)
-                                last_dht_read = datetime.now()
+                                last_dht_read = time.monotonic()
 
+                    last_message_received_ns = self.protocol.last_message_received_ns
                     if (
-                        datetime.now()
-                        > self.protocol.last_message_received + ping_interval
+                        last_message_received_ns is None
+                        or time.monotonic_ns() - last_message_received_ns
+                        > ping_interval_ns
                     ):
                         if await self.ping():
                             failed_pings = 0
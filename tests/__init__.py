@@ -8,3 +8,10 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)-8s %(filename)s:%(lineno)d %(message)s",
     level=logging.DEBUG,
 )
+
+# The pulse lengths and pulse sequence of a switch1 frame, as received and sent by Homeduino
+SWITCH1_PULSES = (
+    b"268 1282 2632 10168 0 0 0 0 "
+    b"0200010001000100010001000100010001000101000100000100010001000100"
+    b"01000101000100010000010001010001000001010000010100000101000001000103"
+)
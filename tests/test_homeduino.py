@@ -2,10 +2,17 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 
+import asyncio
 import logging
 import unittest
+import unittest.mock
+
+from rfcontrol import controller
 
 from homeduino import Homeduino
+from homeduino.homeduino import HomeduinoProtocol
+
+from . import SWITCH1_PULSES
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
@@ -22,3 +29,59 @@ class TestHomeduino(unittest.IsolatedAsyncioTestCase):
         hd = Homeduino("/dev/tty.nonexisting")
         success = await hd.connect()
         self.assertFalse(success)
+
+    async def test_rf_send_packet(self) -> None:
+        hd = Homeduino("/dev/tty.nonexisting")
+        hd.protocol = unittest.mock.Mock(transport=unittest.mock.Mock())
+        hd.protocol.send = unittest.mock.AsyncMock(return_value="ACK")
+        for _ in range(2):
+            success = await hd.rf_send(
+                "switch1", {"id": 98765, "unit": 4, "all": False, "state": True}
+            )
+            self.assertTrue(success)
+            hd.protocol.send.assert_awaited_with(b"RF send 4 7 " + SWITCH1_PULSES)
+
+    async def test_rf_send_packet_pin_change(self) -> None:
+        hd = Homeduino("/dev/tty.nonexisting")
+        hd.protocol = unittest.mock.Mock(transport=unittest.mock.Mock())
+        hd.protocol.send = unittest.mock.AsyncMock(return_value="ACK")
+        values = {"id": 98765, "unit": 4, "all": False, "state": True}
+        await hd.rf_send("switch1", values)
+        hd.rf_send_pin = 7
+        await hd.rf_send("switch1", values)
+        hd.protocol.send.assert_awaited_with(b"RF send 7 7 " + SWITCH1_PULSES)
+
+    async def test_disconnect(self) -> None:
+        hd = Homeduino("/dev/tty.nonexisting")
+        protocol = HomeduinoProtocol()
+        transport = unittest.mock.Mock()
+        transport.close.side_effect = lambda: asyncio.get_running_loop().call_soon(
+            protocol.connection_lost, None
+        )
+        protocol.connection_made(transport)
+        hd.protocol = protocol
+        success = await hd.disconnect()
+        self.assertTrue(success)
+        self.assertFalse(hd.connected())
+
+    def test_get_protocols(self) -> None:
+        protocols = Homeduino.get_protocols()
+        self.assertLess(protocols.index("switch8"), protocols.index("switch10"))
+        protocols.clear()
+        self.assertNotEqual([], Homeduino.get_protocols())
+
+    async def test_rf_send_unknown_protocol(self) -> None:
+        hd = Homeduino("/dev/tty.nonexisting")
+        hd.protocol = unittest.mock.Mock(transport=unittest.mock.Mock())
+        with self.assertRaises(controller.RFControlProtocolNotFoundError):
+            await hd.rf_send("logger", {})
+
+    async def test_analog_and_dht_read(self) -> None:
+        hd = Homeduino("/dev/tty.nonexisting")
+        hd.protocol = unittest.mock.Mock(transport=unittest.mock.Mock())
+        hd.protocol.send = unittest.mock.AsyncMock(return_value="ACK 512")
+        self.assertEqual(512, await hd.analog_read(0))
+        hd.protocol.send.return_value = "ACK 21.5 48.0"
+        self.assertEqual((21.5, 48.0), await hd.dht_read(22, 7))
+        hd.protocol.send.return_value = "ACK error error"
+        self.assertEqual((None, None), await hd.dht_read(22, 7))
@@ -1,17 +1,159 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
 
+import asyncio
 import logging
 import unittest
+import unittest.mock
 
 from homeduino.homeduino import HomeduinoProtocol
 
+from . import SWITCH1_PULSES
+
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
 
 
+class EchoTransport:
+    """Fake transport that echoes every written line back to the protocol."""
+
+    def __init__(self, protocol: HomeduinoProtocol):
+        self.protocol = protocol
+
+    def write(self, data: bytes) -> None:
+        response = data.rstrip(b"\n") + b"\r\n"
+        asyncio.get_running_loop().call_soon(self.protocol.data_received, response)
+
+    def close(self) -> None:
+        self.protocol.connection_lost(None)
+
+
 class TestHomeduinoProtocol(unittest.TestCase):
     def test_init(self) -> None:
         protocol = HomeduinoProtocol()
         self.assertIsInstance(protocol, HomeduinoProtocol)
+
+
+class TestHomeduinoProtocolSend(unittest.IsolatedAsyncioTestCase):
+    async def test_send(self) -> None:
+        protocol = HomeduinoProtocol()
+        protocol.connection_made(EchoTransport(protocol))
+        response = await protocol.send("PING test")
+        self.assertEqual("PING test", response)
+
+    async def test_send_fragmented_response(self) -> None:
+        protocol = HomeduinoProtocol()
+        protocol.connection_made(unittest.mock.Mock())
+        loop = asyncio.get_running_loop()
+        loop.call_soon(protocol.data_received, b"AC")
+        loop.call_soon(protocol.data_received, b"K\r")
+        loop.call_soon(protocol.data_received, b"\n")
+        response = await protocol.send("PM 4 1")
+        self.assertEqual("ACK", response)
+
+    async def test_send_extra_response(self) -> None:
+        protocol = HomeduinoProtocol()
+        protocol.connection_made(unittest.mock.Mock())
+        loop = asyncio.get_running_loop()
+        loop.call_soon(protocol.data_received, b"ACK\r\n")
+        with self.assertLogs("homeduino.homeduino", logging.ERROR) as logs:
+            loop.call_soon(protocol.data_received, b"ACK 1\r\n")
+            response = await protocol.send("PM 4 1")
+            await asyncio.sleep(0)
+        self.assertEqual("ACK", response)
+        self.assertIn("Unhandled data received 'ACK 1'", logs.output[0])
+
+    async def test_send_response_after_failing_line(self) -> None:
+        protocol = HomeduinoProtocol()
+        protocol.connection_made(unittest.mock.Mock())
+        protocol._line_handlers[b"RF"] = unittest.mock.Mock(side_effect=ValueError)
+        loop = asyncio.get_running_loop()
+        loop.call_soon(protocol.data_received, b"RF receive\r\nACK\r\n")
+        with self.assertLogs("homeduino.homeduino", logging.ERROR):
+            response = await protocol.send("PM 4 1")
+        self.assertEqual("ACK", response)
+
+
+class TestHomeduinoProtocolReceive(unittest.IsolatedAsyncioTestCase):
+    async def test_rf_receive(self) -> None:
+        protocol = HomeduinoProtocol()
+        received = []
+        protocol.add_rf_receive_callback(received.append)
+        protocol.data_received(b"RF receive " + SWITCH1_PULSES + b"\r\n")
+        await asyncio.sleep(0)
+        self.assertIn(
+            {
+                "protocol": "switch1",
+                "values": {"id": 98765, "unit": 4, "all": False, "state": True},
+            },
+            received,
+        )
+
+    async def test_rf_receive_repeated_frame(self) -> None:
+        protocol = HomeduinoProtocol()
+        received = []
+        protocol.add_rf_receive_callback(received.append)
+        protocol.data_received(b"RF receive " + SWITCH1_PULSES + b"\r\n")
+        await asyncio.sleep(0)
+        received[0]["values"]["state"] = False
+        protocol.data_received(b"RF receive " + SWITCH1_PULSES + b"\r\n")
+        await asyncio.sleep(0)
+        self.assertEqual(2, len(received))
+        self.assertEqual(
+            {"id": 98765, "unit": 4, "all": False, "state": True},
+            received[1]["values"],
+        )
+
+    async def test_rf_receive_coroutine_callback(self) -> None:
+        protocol = HomeduinoProtocol()
+        received = asyncio.Event()
+
+        async def rf_receive_callback(_decoded) -> None:
+            received.set()
+
+        protocol.add_rf_receive_callback(rf_receive_callback)
+        protocol.data_received(b"RF receive " + SWITCH1_PULSES + b"\r\n")
+        await asyncio.wait_for(received.wait(), 1)
+
+    async def test_rf_receive_async_callable_callback(self) -> None:
+        protocol = HomeduinoProtocol()
+        received = asyncio.Event()
+
+        class RFReceiveCallback:
+            async def __call__(self, _decoded) -> None:
+                received.set()
+
+        protocol.add_rf_receive_callback(RFReceiveCallback())
+        protocol.data_received(b"RF receive " + SWITCH1_PULSES + b"\r\n")
+        await asyncio.wait_for(received.wait(), 1)
+
+    async def test_split_line_end(self) -> None:
+        protocol = HomeduinoProtocol()
+        protocol.data_received(b"rea")
+        protocol.data_received(b"dy\r")
+        self.assertFalse(protocol.ready)
+        protocol.data_received(b"\nKP 1\r\nKP")
+        self.assertTrue(protocol.ready)
+        self.assertEqual(b"KP", bytes(protocol._buffer))
+
+    async def test_rf_receive_malformed(self) -> None:
+        protocol = HomeduinoProtocol()
+        received = []
+        protocol.add_rf_receive_callback(received.append)
+        protocol.data_received(b"RF receive 268 1282\r\n")
+        await asyncio.sleep(0)
+        self.assertEqual([], received)
+
+    async def test_rf_receive_missing_pulse_length(self) -> None:
+        protocol = HomeduinoProtocol()
+        received = []
+        protocol.add_rf_receive_callback(received.append)
+        with self.assertLogs("homeduino.homeduino", logging.WARNING) as logs:
+            protocol.data_received(b"RF receive 268 1282 0 0 0 0 0 0 0159\r\n")
+            protocol.data_received(b"RF receive 0 0 0 0 0 0 0 0 0101\r\n")
+            await asyncio.sleep(0)
+        self.assertEqual([], received)
+        self.assertEqual(2, len(logs.output))
+        self.assertIn("Malformed RF receive message", logs.output[0])